@@ -1,8 +1,14 @@
-RED = "RED"
-BLACK = "BLACK"
+import csv
+import sys
+import weakref
+
+SEPARATOR = "-" * 90
+ROW_FORMAT = "{:<15}{:<15}{:<15}{:<10}{}".format
 
 
 class Symbol:
+    __slots__ = ("name", "data_type", "scope", "line_no", "attributes", "__weakref__")
+
     def __init__(self, name, data_type, scope, line_no):
         self.name = name
         self.data_type = data_type
@@ -11,131 +17,76 @@ class Symbol:
         self.attributes = {}
 
 
-class RBNode:
-    def __init__(self, key, symbol):
-        self.key = key
-        self.symbol = symbol
-        self.color = RED
-        self.left = None
-        self.right = None
-        self.parent = None
-
-
 class SymbolTableRBT:
     def __init__(self):
-        self.NIL = RBNode(None, None)
-        self.NIL.color = BLACK
-        self.root = self.NIL
-
-    # ---------------- ROTATIONS ----------------
-    def left_rotate(self, x):
-        y = x.right
-        x.right = y.left
-        if y.left != self.NIL:
-            y.left.parent = x
-
-        y.parent = x.parent
-        if x.parent is None:
-            self.root = y
-        elif x == x.parent.left:
-            x.parent.left = y
-        else:
-            x.parent.right = y
-
-        y.left = x
-        x.parent = y
-
-    def right_rotate(self, y):
-        x = y.left
-        y.left = x.right
-        if x.right != self.NIL:
-            x.right.parent = y
-
-        x.parent = y.parent
-        if y.parent is None:
-            self.root = x
-        elif y == y.parent.right:
-            y.parent.right = x
+        self.table = {}
+        # Symbols stay identity-equal across reinserts (e.g. free() and reload)
+        # while anything still holds them; kept per table so a reused symbol
+        # is never one another table can reach
+        self._symbol_cache = weakref.WeakValueDictionary()
+
+    def _make_symbol(self, name, data_type, scope, line_no):
+        key = (name, data_type, scope, line_no)
+        sym = self._symbol_cache.get(key)
+        if sym is None:
+            sym = Symbol(name, data_type, scope, line_no)
+            self._symbol_cache[key] = sym
         else:
-            y.parent.left = x
-
-        x.right = y
-        y.parent = x
+            # A reinserted identifier starts without attributes, like a new one
+            sym.attributes.clear()
+        return sym
 
     # ---------------- INSERT ----------------
     def insert(self, name, data_type, scope, line_no):
-        symbol = Symbol(name, data_type, scope, line_no)
-        node = RBNode(name, symbol)
-        node.left = self.NIL
-        node.right = self.NIL
-
-        parent = None
-        current = self.root
-
-        while current != self.NIL:
-            parent = current
-            if node.key < current.key:
-                current = current.left
-            elif node.key > current.key:
-                current = current.right
-            else:
-                print("\nIdentifier already exists.")
-                return
-
-        node.parent = parent
-        if parent is None:
-            self.root = node
-        elif node.key < parent.key:
-            parent.left = node
-        else:
-            parent.right = node
+        if not self._insert_no_print(name, data_type, scope, line_no):
+            print("\nIdentifier already exists.")
+            return
 
-        self.fix_insert(node)
         print("\nIdentifier inserted successfully.")
 
-    def fix_insert(self, z):
-        while z.parent and z.parent.color == RED:
-            if z.parent == z.parent.parent.left:
-                y = z.parent.parent.right
-                if y.color == RED:
-                    z.parent.color = BLACK
-                    y.color = BLACK
-                    z.parent.parent.color = RED
-                    z = z.parent.parent
-                else:
-                    if z == z.parent.right:
-                        z = z.parent
-                        self.left_rotate(z)
-                    z.parent.color = BLACK
-                    z.parent.parent.color = RED
-                    self.right_rotate(z.parent.parent)
-            else:
-                y = z.parent.parent.left
-                if y.color == RED:
-                    z.parent.color = BLACK
-                    y.color = BLACK
-                    z.parent.parent.color = RED
-                    z = z.parent.parent
-                else:
-                    if z == z.parent.left:
-                        z = z.parent
-                        self.right_rotate(z)
-                    z.parent.color = BLACK
-                    z.parent.parent.color = RED
-                    self.left_rotate(z.parent.parent)
-        self.root.color = BLACK
+    def _insert_no_print(self, name, data_type, scope, line_no):
+        if name in self.table:
+            return False
+
+        self.table[name] = self._make_symbol(name, data_type, scope, line_no)
+        return True
+
+    def insert_many(self, rows):
+        # Returns (inserted, skipped); rows that are not exactly
+        # name,type,scope,line with an integer line (e.g. a header) are skipped
+        inserted = skipped = 0
+        for row in rows:
+            fields = [field.strip() for field in row]
+            if len(fields) != 4:
+                skipped += 1
+                continue
+            name, data_type, scope, line_no = fields
+            try:
+                line_no = int(line_no)
+            except ValueError:
+                skipped += 1
+                continue
+            if self._insert_no_print(name, data_type, scope, line_no):
+                inserted += 1
+        return inserted, skipped
+
+    def load_csv(self, path):
+        # Each row: identifier,data type,scope,line number
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = [row for row in csv.reader(f) if row]
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"\nCould not load {path}: {e}")
+            return
+        inserted, skipped = self.insert_many(rows)
+        summary = f"\nLoaded {inserted} of {len(rows)} identifiers from {path}"
+        if skipped:
+            summary += f" ({skipped} malformed row{'s' if skipped != 1 else ''} skipped)"
+        print(summary + ".")
 
     # ---------------- SEARCH ----------------
     def lookup(self, name):
-        current = self.root
-        while current != self.NIL:
-            if name == current.key:
-                return current.symbol
-            elif name < current.key:
-                current = current.left
-            else:
-                current = current.right
-        return None
+        return self.table.get(name)
 
     # ---------------- ATTRIBUTES ----------------
     def set_attribute(self, name, key, value):
@@ -153,33 +104,29 @@ class SymbolTableRBT:
         return None
 
     # ---------------- DISPLAY ----------------
-    def inorder(self, node, rows):
-        if node != self.NIL:
-            self.inorder(node.left, rows)
-            rows.append(node.symbol)
-            self.inorder(node.right, rows)
-
     def display(self):
-        rows = []
-        self.inorder(self.root, rows)
+        rows = sorted(self.table.values(), key=lambda s: s.name)
 
         if not rows:
             print("\nSymbol Table is empty.")
             return
 
-        print("\n" + "-" * 90)
-        print(f"{'Identifier':<15}{'Type':<15}{'Scope':<15}{'Line No':<10}{'Attributes'}")
-        print("-" * 90)
-
-        for s in rows:
-            attrs = ", ".join(f"{k}:{v}" for k, v in s.attributes.items())
-            print(f"{s.name:<15}{s.data_type:<15}{s.scope:<15}{s.line_no:<10}{attrs}")
-
-        print("-" * 90)
+        lines = [
+            "\n" + SEPARATOR,
+            ROW_FORMAT("Identifier", "Type", "Scope", "Line No", "Attributes"),
+            SEPARATOR,
+        ]
+        lines.extend(
+            ROW_FORMAT(s.name, s.data_type, s.scope, s.line_no,
+                       ", ".join(f"{k}:{v}" for k, v in s.attributes.items()))
+            for s in rows
+        )
+        lines.append(SEPARATOR)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # ---------------- FREE ----------------
     def free(self):
-        self.root = self.NIL
+        self.table.clear()
         print("\nSymbol Table cleared.")
 
 
@@ -200,6 +147,9 @@ def menu():
 if __name__ == "__main__":
     st = SymbolTableRBT()
 
+    if len(sys.argv) > 1:
+        st.load_csv(sys.argv[1])
+
     while True:
         menu()
         choice = input("Enter your choice: ")
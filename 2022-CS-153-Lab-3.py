@@ -1,44 +1,33 @@
 import threading
+from queue import Queue
 
 BUFFER_SIZE = 100
-bufferA = []
-bufferB = []
-active_buffer = bufferA
-inactive_buffer = bufferB
-lock = threading.Lock()
-switch_flag = False  
-stop_program = False
+line_queue = Queue(maxsize=BUFFER_SIZE)
 
-def fill_buffer(buffer):
-    global switch_flag, stop_program 
+def fill_buffer(q):
     print("Enter program (q to quit):")
-    while not stop_program:
-        lock.acquire()
-        
-
-        if not switch_flag:
-            user_input = input()
-
-            if user_input == "q":
-                stop_program = True
-                lock.release()
-                break
+    while True:
+        user_input = input()
 
-            buffer.append(user_input)
+        if user_input == "q":
+            q.put(None)
+            break
 
-            if len(buffer) >= BUFFER_SIZE:
-                switch_flag = True
-
-        lock.release()
+        q.put(user_input)
 
         
         
-def process_data(buffer):
-    global switch_flag, stop_program
+def process_data(q):
+    buffer = []
+
+    while True:
+        item = q.get()
+        if item is None:
+            break
+
+        buffer.append(item)
 
-    while not stop_program:
-        lock.acquire()
-        if switch_flag == True:
+        if len(buffer) >= BUFFER_SIZE:
             data_string = ''.join(buffer)
 
             words = data_string.split()
@@ -46,37 +35,19 @@ def process_data(buffer):
             print("Processed words:", words)
 
             buffer.clear()
-            switch_flag = False
-
-        lock.release()
 
                 
         
 def main():
-    global switch_flag, stop_program ,  active_buffer, inactive_buffer
-    
-    
-    producer_thread = threading.Thread(target=fill_buffer, args=(active_buffer,))
-    consumer_thread = threading.Thread(target=process_data, args=(active_buffer,))
+    producer_thread = threading.Thread(target=fill_buffer, args=(line_queue,))
+    consumer_thread = threading.Thread(target=process_data, args=(line_queue,))
     
     producer_thread.start()
     consumer_thread.start()
     
-    while not stop_program:
-        
-        if switch_flag == True:
-            
-            if active_buffer == bufferA:
-                active_buffer = bufferB
-                inactive_buffer = bufferA
-            else:
-                active_buffer = bufferA
-                inactive_buffer = bufferB
-                
     producer_thread.join()
     consumer_thread.join()
 
     print("Program Exited")
                  
 main()
-
@@ -1,8 +1,60 @@
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+
+NUMPY_MIN_LENGTH = 32
+
+
+def is_char_sequence(seq):
+    return all(isinstance(x, str) and len(x) == 1 for x in seq)
+
+
+def numeric_arrays(pattern, lst):
+    # NumPy only speeds this up on a native dtype, so use it just when both
+    # sequences hold only ints or only floats; NaN is left to the loop since
+    # slice comparison treats an identical NaN as equal and NumPy does not
+    types = set(map(type, pattern)) | set(map(type, lst))
+    if types == {int}:
+        dtype = np.int64
+    elif types == {float}:
+        dtype = np.float64
+    else:
+        return None
+    try:
+        arr = np.fromiter(lst, dtype=dtype, count=len(lst))
+        pat = np.fromiter(pattern, dtype=dtype, count=len(pattern))
+    except OverflowError:
+        return None
+    if dtype is np.float64 and (np.isnan(arr).any() or np.isnan(pat).any()):
+        return None
+    return arr, pat
+
+
 def count_pattern(pattern, lst):
     lst_length = len(lst)
     pattern_length = len(pattern)
     if lst_length < pattern_length:
         return 0
+    # A slice never equals a pattern of another sequence type, so the fast
+    # paths below only apply when both inputs share one
+    same_type = type(lst) is type(pattern)
+    if same_type and is_char_sequence(lst) and is_char_sequence(pattern):
+        text = ''.join(lst)
+        word = ''.join(pattern)
+        count = 0
+        i = text.find(word)
+        while i != -1:
+            count += 1
+            i = text.find(word, i + 1)
+        return count
+    if same_type and np is not None and lst_length >= NUMPY_MIN_LENGTH and pattern_length > 0:
+        arrays = numeric_arrays(pattern, lst)
+        if arrays is not None:
+            arr, pat = arrays
+            windows = sliding_window_view(arr, pattern_length)
+            return int((windows == pat).all(axis=1).sum())
     i= 0
     count= 0
     while i <= lst_length - pattern_length:
@@ -4,12 +4,16 @@ def depth(x):
     
 
     max_depth = 0
-    for i in x:
-        item_depth = depth(i)
-        if item_depth > max_depth:
-            max_depth = item_depth   
+    stack = [(x, 1)]
+    while stack:
+        node, node_depth = stack.pop()
+        if node_depth > max_depth:
+            max_depth = node_depth
+        for i in node:
+            if isinstance(i,(list,tuple)):
+                stack.append((i, node_depth + 1))
 
-    return 1 + max_depth
+    return max_depth
 
 print(depth('x'))
 print(depth(('expt', 'x', 2)))
@@ -1,8 +1,8 @@
+from functools import reduce
+from operator import getitem
+
 def tree_ref(tree, indices):
-    curr = tree
-    for i in indices:
-        curr = curr[i]
-    return curr
+    return reduce(getitem, indices, tree)
 
 tree = (((1, 2), 3), (4, (5, 6)), 7, (8, 9, 10))
 print(tree_ref(tree,(3,1)))
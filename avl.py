@@ -1,30 +1,22 @@
 class AVLNode:
+    __slots__ = ("key", "left", "right", "rank")
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
-        self.height = 1
+        self.rank = 0
 
 
 class AVLTree:
+    # Balanced with the WAVL (weak AVL) rank rules: missing children have
+    # rank -1, every rank difference between parent and child is 1 or 2,
+    # and leaves have rank 0. Inserts rebalance exactly like AVL; deletes
+    # mostly demote ranks and rotate at most twice.
+
     def __init__(self):
         self.root = None
 
-    def get_height(self, node):
-        if not node:
-            return 0
-        return node.height
-
-    def get_balance(self, node):
-        if not node:
-            return 0
-        return self.get_height(node.left) - self.get_height(node.right)
-
-    def update_height(self, node):
-        if not node:
-            return
-        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
-
     def rotate_right(self, z):
         y = z.left
         T3 = y.right
@@ -33,10 +25,6 @@ class AVLTree:
         y.right = z
         z.left = T3
 
-        # Update heights
-        self.update_height(z)
-        self.update_height(y)
-
         return y
 
     def rotate_left(self, z):
@@ -47,48 +35,77 @@ class AVLTree:
         y.left = z
         z.right = T2
 
-        # Update heights
-        self.update_height(z)
-        self.update_height(y)
-
         return y
 
+    def replace_child(self, root, path, i, new_node):
+        # Point path[i]'s parent (or the root) at the new subtree top
+        if i == 0:
+            return new_node
+        parent, went_left = path[i - 1]
+        if went_left:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        return root
+
     def insert(self, node, key):
-        # Standard BST insertion
+        # Standard BST insertion, recording the descent path
         if not node:
             return AVLNode(key)
 
-        if key < node.key:
-            node.left = self.insert(node.left, key)
-        elif key > node.key:
-            node.right = self.insert(node.right, key)
+        path = []
+        current = node
+        while current:
+            if key < current.key:
+                path.append((current, True))
+                current = current.left
+            elif key > current.key:
+                path.append((current, False))
+                current = current.right
+            else:
+                # Duplicate keys not allowed
+                return node
+
+        x = AVLNode(key)
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = x
         else:
-            # Duplicate keys not allowed
-            return node
-
-        # Update height
-        self.update_height(node)
-
-        # Get balance factor
-        balance = self.get_balance(node)
-
-        # Left Left Case
-        if balance > 1 and key < node.left.key:
-            return self.rotate_right(node)
-
-        # Right Right Case
-        if balance < -1 and key > node.right.key:
-            return self.rotate_left(node)
-
-        # Left Right Case
-        if balance > 1 and key > node.left.key:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
-
-        # Right Left Case
-        if balance < -1 and key < node.right.key:
-            node.right = self.rotate_right(node.right)
-            return self.rotate_left(node)
+            parent.right = x
+
+        # Walk up while x is a 0-child (same rank as its parent)
+        i = len(path) - 1
+        while i >= 0:
+            p, x_left = path[i]
+            if p.rank != x.rank:
+                break
+
+            sibling = p.right if x_left else p.left
+            sibling_rank = sibling.rank if sibling else -1
+
+            # 0,1 node: promote and keep walking up
+            if p.rank - sibling_rank == 1:
+                p.rank += 1
+                x = p
+                i -= 1
+                continue
+
+            # 0,2 node: one single or double rotation finishes the insert
+            inner = x.right if x_left else x.left
+            if not inner or x.rank - inner.rank == 2:
+                top = self.rotate_right(p) if x_left else self.rotate_left(p)
+                p.rank -= 1
+            else:
+                if x_left:
+                    p.left = self.rotate_left(x)
+                    top = self.rotate_right(p)
+                else:
+                    p.right = self.rotate_right(x)
+                    top = self.rotate_left(p)
+                inner.rank += 1
+                x.rank -= 1
+                p.rank -= 1
+            return self.replace_child(node, path, i, top)
 
         return node
 
@@ -102,52 +119,97 @@ class AVLTree:
         return current
 
     def delete(self, node, key):
-        # Standard BST deletion
-        if not node:
+        # Standard BST deletion, recording the descent path
+        path = []
+        current = node
+        while current and current.key != key:
+            if key < current.key:
+                path.append((current, True))
+                current = current.left
+            else:
+                path.append((current, False))
+                current = current.right
+
+        if not current:
             return node
 
-        if key < node.key:
-            node.left = self.delete(node.left, key)
-        elif key > node.key:
-            node.right = self.delete(node.right, key)
+        if current.left and current.right:
+            # Node with two children: copy the inorder successor's key
+            # and remove the successor from the right subtree instead
+            path.append((current, False))
+            target = current
+            current = current.right
+            while current.left:
+                path.append((current, True))
+                current = current.left
+            target.key = current.key
+
+        # Node with only one child or no child
+        x = current.left if current.left else current.right
+        if not path:
+            return x
+
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = x
         else:
-            # Node with only one child or no child
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
-
-            # Node with two children
-            temp = self.get_min_value_node(node.right)
-            node.key = temp.key
-            node.right = self.delete(node.right, temp.key)
-
-        if not node:
-            return node
-
-        # Update height
-        self.update_height(node)
-
-        # Get balance factor
-        balance = self.get_balance(node)
-
-        # Left Left Case
-        if balance > 1 and self.get_balance(node.left) >= 0:
-            return self.rotate_right(node)
-
-        # Left Right Case
-        if balance > 1 and self.get_balance(node.left) < 0:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
-
-        # Right Right Case
-        if balance < -1 and self.get_balance(node.right) <= 0:
-            return self.rotate_left(node)
-
-        # Right Left Case
-        if balance < -1 and self.get_balance(node.right) > 0:
-            node.right = self.rotate_right(node.right)
-            return self.rotate_left(node)
+            parent.right = x
+
+        i = len(path) - 1
+
+        # A 2,2 leaf is not allowed: demote it
+        if not parent.left and not parent.right and parent.rank == 1:
+            parent.rank = 0
+            x = parent
+            i -= 1
+
+        # Walk up while x is a 3-child
+        while i >= 0:
+            p, x_left = path[i]
+            x_rank = x.rank if x else -1
+            if p.rank - x_rank != 3:
+                break
+
+            y = p.right if x_left else p.left
+
+            # Sibling is a 2-child: demote p and keep walking up
+            if p.rank - y.rank == 2:
+                p.rank -= 1
+                x = p
+                i -= 1
+                continue
+
+            outer = y.right if x_left else y.left
+            inner = y.left if x_left else y.right
+            outer_rank = outer.rank if outer else -1
+            inner_rank = inner.rank if inner else -1
+
+            # Sibling is a 2,2 node: demote both and keep walking up
+            if y.rank - outer_rank == 2 and y.rank - inner_rank == 2:
+                y.rank -= 1
+                p.rank -= 1
+                x = p
+                i -= 1
+                continue
+
+            # Otherwise one single or double rotation finishes the delete
+            if y.rank - outer_rank == 1:
+                top = self.rotate_left(p) if x_left else self.rotate_right(p)
+                y.rank += 1
+                p.rank -= 1
+                if not p.left and not p.right:
+                    p.rank -= 1
+            else:
+                if x_left:
+                    p.right = self.rotate_right(y)
+                    top = self.rotate_left(p)
+                else:
+                    p.left = self.rotate_left(y)
+                    top = self.rotate_right(p)
+                inner.rank += 2
+                y.rank -= 1
+                p.rank -= 2
+            return self.replace_child(node, path, i, top)
 
         return node
 
@@ -155,21 +217,23 @@ class AVLTree:
         self.root = self.delete(self.root, key)
 
     def search(self, node, key):
-        if not node or node.key == key:
-            return node
-
-        if key < node.key:
-            return self.search(node.left, key)
-        return self.search(node.right, key)
+        while node and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
 
     def search_key(self, key):
         return self.search(self.root, key)
 
     def inorder_traversal(self, node, result):
-        if node:
-            self.inorder_traversal(node.left, result)
-            result.append(node.key)
-            self.inorder_traversal(node.right, result)
+        stack = []
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                result.append(node.key)
+                node = node.right
 
     def inorder(self):
         result = []
@@ -177,10 +241,14 @@ class AVLTree:
         return result
 
     def preorder_traversal(self, node, result):
-        if node:
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
             result.append(node.key)
-            self.preorder_traversal(node.left, result)
-            self.preorder_traversal(node.right, result)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
 
     def preorder(self):
         result = []
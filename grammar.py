@@ -3,7 +3,19 @@ Pascal LL(1) Grammar Definition
 Contains grammar productions, FIRST sets, FOLLOW sets, and LL(1) parsing table
 """
 
-from lexer import TokenType
+import sys
+from lexer import TOKEN_TO_TERMINAL, TERMINAL_BY_TYPE
+
+# TOKEN_TO_TERMINAL and TERMINAL_BY_TYPE live in lexer.py so each Token can
+# carry its terminal string from lex time; they are re-exported from here.
+__all__ = [
+    'TOKEN_TO_TERMINAL', 'TERMINAL_BY_TYPE',
+    'NONTERMINALS', 'TERMINALS', 'EPSILON', 'PRODUCTIONS', 'FIRST', 'FOLLOW',
+    'PARSE_TABLE', 'EPSILON_PROD',
+    'SYMBOL_NAME', 'SYMBOL_ID', 'N_TERM', 'EPSILON_ID', 'NT_BASE', 'EOF_ID',
+    'START_ID', 'PARSE_TABLE_ARR', 'EPSILON_ID_PROD', 'TERM_ID_BY_TYPE',
+    'is_terminal', 'is_nonterminal', 'get_production', 'production_to_string',
+]
 
 # ============================================================================
 # GRAMMAR SYMBOLS
@@ -35,7 +47,7 @@ EPSILON = 'ε'
 # ============================================================================
 # PRODUCTIONS
 # Stored as: nonterminal -> list of production alternatives
-# Each production is a list of symbols (terminals/nonterminals)
+# Each production is a sequence of symbols (terminals/nonterminals)
 # ============================================================================
 
 PRODUCTIONS = {
@@ -215,9 +227,15 @@ FOLLOW = {
     'Factor': {'*', '/', 'div', 'mod', '+', '-', ')', ';', ',', 'then', 'do', '<', '>', '<=', '>=', '=', '<>'}
 }
 
+# FIRST/FOLLOW sets are frozen and equal sets share one object
+_SET_POOL = {}
+
+FIRST = {nt: _SET_POOL.setdefault(frozenset(s), frozenset(s)) for nt, s in FIRST.items()}
+FOLLOW = {nt: _SET_POOL.setdefault(frozenset(s), frozenset(s)) for nt, s in FOLLOW.items()}
+
 # ============================================================================
 # LL(1) PARSING TABLE
-# Format: PARSE_TABLE[nonterminal][terminal] = production (list of symbols)
+# Format: PARSE_TABLE[nonterminal][terminal] = production (tuple of symbols)
 # ============================================================================
 
 PARSE_TABLE = {
@@ -409,48 +427,63 @@ PARSE_TABLE = {
 }
 
 # ============================================================================
-# TOKEN TO TERMINAL MAPPING
+# PRODUCTION INTERNING
+# Every production is stored as a tuple of interned symbol strings, and
+# equal right-hand sides share one object across PRODUCTIONS and
+# PARSE_TABLE. EPSILON_PROD is the single shared epsilon production, so
+# callers can test it with `is`.
 # ============================================================================
 
-TOKEN_TO_TERMINAL = {
-    TokenType.PROGRAM: 'program',
-    TokenType.VAR: 'var',
-    TokenType.BEGIN: 'begin',
-    TokenType.END: 'end',
-    TokenType.INTEGER: 'integer',
-    TokenType.REAL: 'real',
-    TokenType.BOOLEAN: 'boolean',
-    TokenType.IF: 'if',
-    TokenType.THEN: 'then',
-    TokenType.ELSE: 'else',
-    TokenType.WHILE: 'while',
-    TokenType.DO: 'do',
-    TokenType.READ: 'read',
-    TokenType.WRITE: 'write',
-    TokenType.DIV: 'div',
-    TokenType.MOD: 'mod',
-    TokenType.ID: 'id',
-    TokenType.NUM: 'num',
-    TokenType.PLUS: '+',
-    TokenType.MINUS: '-',
-    TokenType.MULTIPLY: '*',
-    TokenType.DIVIDE: '/',
-    TokenType.ASSIGN: ':=',
-    TokenType.EQUAL: '=',
-    TokenType.NOT_EQUAL: '<>',
-    TokenType.LESS: '<',
-    TokenType.GREATER: '>',
-    TokenType.LESS_EQUAL: '<=',
-    TokenType.GREATER_EQUAL: '>=',
-    TokenType.LPAREN: '(',
-    TokenType.RPAREN: ')',
-    TokenType.SEMICOLON: ';',
-    TokenType.COLON: ':',
-    TokenType.COMMA: ',',
-    TokenType.DOT: '.',
-    TokenType.EOF: '$'
+_PRODUCTION_POOL = {}
+
+
+def _intern_production(production) -> tuple:
+    production = tuple(sys.intern(symbol) for symbol in production)
+    return _PRODUCTION_POOL.setdefault(production, production)
+
+
+PRODUCTIONS = {
+    nt: tuple(_intern_production(prod) for prod in prods)
+    for nt, prods in PRODUCTIONS.items()
+}
+
+PARSE_TABLE = {
+    nt: {terminal: _intern_production(prod) for terminal, prod in row.items()}
+    for nt, row in PARSE_TABLE.items()
 }
 
+EPSILON_PROD = _PRODUCTION_POOL[(EPSILON,)]
+
+# ============================================================================
+# INTEGER-INDEXED PARSING TABLE
+# Symbol ids: terminals are 0 .. N_TERM-1, EPSILON_ID == N_TERM, and
+# nonterminals start at NT_BASE. Format: PARSE_TABLE_ARR[nt_id - NT_BASE]
+# [terminal_id] = production as a tuple of symbol ids, or None if error.
+# ============================================================================
+
+SYMBOL_NAME = [sys.intern(symbol) for symbol in TERMINALS + [EPSILON] + NONTERMINALS]
+SYMBOL_ID = {symbol: i for i, symbol in enumerate(SYMBOL_NAME)}
+
+N_TERM = len(TERMINALS)
+EPSILON_ID = SYMBOL_ID[EPSILON]
+NT_BASE = EPSILON_ID + 1
+EOF_ID = SYMBOL_ID['$']
+START_ID = SYMBOL_ID['Program']
+
+_ID_PRODUCTION_POOL = {}
+
+PARSE_TABLE_ARR = [[None] * N_TERM for _ in NONTERMINALS]
+for _nt, _row in PARSE_TABLE.items():
+    for _terminal, _production in _row.items():
+        _ids = tuple(SYMBOL_ID[symbol] for symbol in _production)
+        PARSE_TABLE_ARR[SYMBOL_ID[_nt] - NT_BASE][SYMBOL_ID[_terminal]] = \
+            _ID_PRODUCTION_POOL.setdefault(_ids, _ids)
+
+EPSILON_ID_PROD = _ID_PRODUCTION_POOL[(EPSILON_ID,)]
+
+# Terminal id for each token type, indexed by TokenType.value
+TERM_ID_BY_TYPE = [SYMBOL_ID[t] if t is not None else None for t in TERMINAL_BY_TYPE]
+
 
 def is_terminal(symbol: str) -> bool:
     """Check if a symbol is a terminal"""
@@ -469,9 +502,9 @@ def get_production(nonterminal: str, terminal: str):
     return None
 
 
-def production_to_string(nonterminal: str, production: list) -> str:
+def production_to_string(nonterminal: str, production: tuple) -> str:
     """Convert production to readable string"""
-    rhs = ' '.join(production) if production != [EPSILON] else 'ε'
+    rhs = ' '.join(production) if production != EPSILON_PROD else 'ε'
     return f"{nonterminal} → {rhs}"
 
 
@@ -495,10 +528,10 @@ if __name__ == "__main__":
     print("FIRST SETS:")
     print("-" * 40)
     for nt in NONTERMINALS:
-        print(f"  FIRST({nt}) = {FIRST[nt]}")
+        print(f"  FIRST({nt}) = {set(FIRST[nt])}")
     
     print("\n" + "-" * 40)
     print("FOLLOW SETS:")
     print("-" * 40)
     for nt in NONTERMINALS:
-        print(f"  FOLLOW({nt}) = {FOLLOW[nt]}")
+        print(f"  FOLLOW({nt}) = {set(FOLLOW[nt])}")
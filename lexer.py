@@ -3,8 +3,10 @@ Pascal Lexer/Scanner for LL(1) Parser
 Tokenizes Pascal source code into a stream of tokens
 """
 
+import re
+import sys
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 class TokenType(Enum):
@@ -55,12 +57,64 @@ class TokenType(Enum):
     EOF = auto()
 
 
+# Terminal string used by the grammar for each token type
+TOKEN_TO_TERMINAL = {
+    TokenType.PROGRAM: 'program',
+    TokenType.VAR: 'var',
+    TokenType.BEGIN: 'begin',
+    TokenType.END: 'end',
+    TokenType.INTEGER: 'integer',
+    TokenType.REAL: 'real',
+    TokenType.BOOLEAN: 'boolean',
+    TokenType.IF: 'if',
+    TokenType.THEN: 'then',
+    TokenType.ELSE: 'else',
+    TokenType.WHILE: 'while',
+    TokenType.DO: 'do',
+    TokenType.READ: 'read',
+    TokenType.WRITE: 'write',
+    TokenType.DIV: 'div',
+    TokenType.MOD: 'mod',
+    TokenType.ID: 'id',
+    TokenType.NUM: 'num',
+    TokenType.PLUS: '+',
+    TokenType.MINUS: '-',
+    TokenType.MULTIPLY: '*',
+    TokenType.DIVIDE: '/',
+    TokenType.ASSIGN: ':=',
+    TokenType.EQUAL: '=',
+    TokenType.NOT_EQUAL: '<>',
+    TokenType.LESS: '<',
+    TokenType.GREATER: '>',
+    TokenType.LESS_EQUAL: '<=',
+    TokenType.GREATER_EQUAL: '>=',
+    TokenType.LPAREN: '(',
+    TokenType.RPAREN: ')',
+    TokenType.SEMICOLON: ';',
+    TokenType.COLON: ':',
+    TokenType.COMMA: ',',
+    TokenType.DOT: '.',
+    TokenType.EOF: '$'
+}
+
+# Same mapping as a flat list indexed by TokenType.value, with interned
+# strings so the parser's terminal comparisons are cheap.  Each member also
+# carries its terminal directly as TokenType.<NAME>.terminal.
+TERMINAL_BY_TYPE: List[Optional[str]] = [None] * (max(t.value for t in TokenType) + 1)
+for _token_type, _terminal in TOKEN_TO_TERMINAL.items():
+    TERMINAL_BY_TYPE[_token_type.value] = _token_type.terminal = sys.intern(_terminal)
+
+
 @dataclass
 class Token:
     type: TokenType
     value: str
     line: int
     column: int
+    term: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.term = self.type.terminal
     
     def __repr__(self):
         return f"Token({self.type.name}, '{self.value}', line={self.line}, col={self.column})"
@@ -74,28 +128,78 @@ class LexerError(Exception):
         super().__init__(f"Lexer Error at line {line}, column {column}: {message}")
 
 
+# ============================================================================
+# SCANNER TABLES
+# Built once at import time and shared by every Lexer instance
+# ============================================================================
+
+# Reserved words mapping
+_KEYWORDS = {
+    'program': TokenType.PROGRAM,
+    'var': TokenType.VAR,
+    'begin': TokenType.BEGIN,
+    'end': TokenType.END,
+    'integer': TokenType.INTEGER,
+    'real': TokenType.REAL,
+    'boolean': TokenType.BOOLEAN,
+    'if': TokenType.IF,
+    'then': TokenType.THEN,
+    'else': TokenType.ELSE,
+    'while': TokenType.WHILE,
+    'do': TokenType.DO,
+    'read': TokenType.READ,
+    'write': TokenType.WRITE,
+    'div': TokenType.DIV,
+    'mod': TokenType.MOD,
+}
+
+# Keywords grouped by length: identifiers of any other length (x, i,
+# counter, ...) skip lowercasing and the keyword lookup entirely
+_KEYWORDS_BY_LENGTH = {}
+for _word, _token_type in _KEYWORDS.items():
+    _KEYWORDS_BY_LENGTH.setdefault(len(_word), {})[_word] = _token_type
+
+# Operators and punctuation mapping
+_OPERATORS = {
+    ':=': TokenType.ASSIGN,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL,
+    '<>': TokenType.NOT_EQUAL,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '=': TokenType.EQUAL,
+    '<': TokenType.LESS,
+    '>': TokenType.GREATER,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    ';': TokenType.SEMICOLON,
+    ':': TokenType.COLON,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+}
+
+# Single compiled scanner: comments come before operators so '(*' is
+# not read as '(', and two-character operators before one-character ones
+_TOKEN_RE = re.compile(r"""
+     (?P<WS>\s+)
+    |(?P<COMMENT>\{[^}]*\}?|\(\*.*?(?:\*\)|\Z))
+    |(?P<NUM>\d+(?:\.\d+)?)
+    |(?P<ID>[^\W\d]\w*)
+    |(?P<OP>:=|<=|>=|<>|[-+*/=<>();:,.])
+    |(?P<ERROR>.)
+""", re.VERBOSE | re.DOTALL)
+
+
 class Lexer:
     """Pascal Lexer - converts source code to tokens"""
     
-    # Reserved words mapping
-    KEYWORDS = {
-        'program': TokenType.PROGRAM,
-        'var': TokenType.VAR,
-        'begin': TokenType.BEGIN,
-        'end': TokenType.END,
-        'integer': TokenType.INTEGER,
-        'real': TokenType.REAL,
-        'boolean': TokenType.BOOLEAN,
-        'if': TokenType.IF,
-        'then': TokenType.THEN,
-        'else': TokenType.ELSE,
-        'while': TokenType.WHILE,
-        'do': TokenType.DO,
-        'read': TokenType.READ,
-        'write': TokenType.WRITE,
-        'div': TokenType.DIV,
-        'mod': TokenType.MOD,
-    }
+    # Scanner tables are module-level singletons shared by every Lexer
+    KEYWORDS = _KEYWORDS
+    KEYWORDS_BY_LENGTH = _KEYWORDS_BY_LENGTH
+    OPERATORS = _OPERATORS
+    TOKEN_PATTERN = _TOKEN_RE
     
     def __init__(self, source: str):
         self.source = source
@@ -128,159 +232,49 @@ class Lexer:
             self.column += 1
         return char
     
-    def skip_whitespace(self):
-        """Skip whitespace characters"""
-        while self.current_char() and self.current_char().isspace():
-            self.advance()
-    
-    def skip_comment(self):
-        """Skip Pascal comments: { } or (* *)"""
-        if self.current_char() == '{':
-            self.advance()  # Skip {
-            while self.current_char() and self.current_char() != '}':
-                self.advance()
-            if self.current_char() == '}':
-                self.advance()  # Skip }
-        elif self.current_char() == '(' and self.peek() == '*':
-            self.advance()  # Skip (
-            self.advance()  # Skip *
-            while self.current_char():
-                if self.current_char() == '*' and self.peek() == ')':
-                    self.advance()  # Skip *
-                    self.advance()  # Skip )
-                    break
-                self.advance()
-    
-    def read_number(self) -> Token:
-        """Read a number literal (integer or real)"""
-        start_line = self.line
-        start_col = self.column
-        result = ''
-        
-        while self.current_char() and self.current_char().isdigit():
-            result += self.advance()
-        
-        # Check for real number
-        if self.current_char() == '.' and self.peek() and self.peek().isdigit():
-            result += self.advance()  # Add .
-            while self.current_char() and self.current_char().isdigit():
-                result += self.advance()
-        
-        return Token(TokenType.NUM, result, start_line, start_col)
-    
-    def read_identifier(self) -> Token:
-        """Read an identifier or keyword"""
-        start_line = self.line
-        start_col = self.column
-        result = ''
-        
-        while self.current_char() and (self.current_char().isalnum() or self.current_char() == '_'):
-            result += self.advance()
-        
-        # Check if it's a keyword (case insensitive)
-        lower_result = result.lower()
-        if lower_result in self.KEYWORDS:
-            return Token(self.KEYWORDS[lower_result], result, start_line, start_col)
-        
-        return Token(TokenType.ID, result, start_line, start_col)
-    
     def tokenize(self) -> List[Token]:
         """Convert source code to list of tokens"""
         self.tokens = []
+        tokens_append = self.tokens.append
+        source = self.source
+        keywords_by_length = _KEYWORDS_BY_LENGTH
+        operators = _OPERATORS
+        line = 1
+        line_start = 0
         
-        while self.current_char():
-            # Skip whitespace
-            if self.current_char().isspace():
-                self.skip_whitespace()
-                continue
-            
-            # Skip comments
-            if self.current_char() == '{' or (self.current_char() == '(' and self.peek() == '*'):
-                self.skip_comment()
-                continue
-            
-            start_line = self.line
-            start_col = self.column
-            
-            # Numbers
-            if self.current_char().isdigit():
-                self.tokens.append(self.read_number())
-                continue
-            
-            # Identifiers and keywords
-            if self.current_char().isalpha() or self.current_char() == '_':
-                self.tokens.append(self.read_identifier())
-                continue
-            
-            # Two-character operators
-            if self.current_char() == ':' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.ASSIGN, ':=', start_line, start_col))
-                continue
-            
-            if self.current_char() == '<' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.LESS_EQUAL, '<=', start_line, start_col))
-                continue
-            
-            if self.current_char() == '>' and self.peek() == '=':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.GREATER_EQUAL, '>=', start_line, start_col))
-                continue
+        for match in _TOKEN_RE.finditer(source):
+            kind = match.lastgroup
+            text = match.group()
             
-            if self.current_char() == '<' and self.peek() == '>':
-                self.advance()
-                self.advance()
-                self.tokens.append(Token(TokenType.NOT_EQUAL, '<>', start_line, start_col))
+            # Skip whitespace and comments, tracking line starts
+            if kind == 'WS' or kind == 'COMMENT':
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = match.start() + text.rindex('\n') + 1
                 continue
             
-            # Single-character tokens
-            char = self.current_char()
+            column = match.start() - line_start + 1
             
-            if char == '+':
-                self.advance()
-                self.tokens.append(Token(TokenType.PLUS, '+', start_line, start_col))
-            elif char == '-':
-                self.advance()
-                self.tokens.append(Token(TokenType.MINUS, '-', start_line, start_col))
-            elif char == '*':
-                self.advance()
-                self.tokens.append(Token(TokenType.MULTIPLY, '*', start_line, start_col))
-            elif char == '/':
-                self.advance()
-                self.tokens.append(Token(TokenType.DIVIDE, '/', start_line, start_col))
-            elif char == '=':
-                self.advance()
-                self.tokens.append(Token(TokenType.EQUAL, '=', start_line, start_col))
-            elif char == '<':
-                self.advance()
-                self.tokens.append(Token(TokenType.LESS, '<', start_line, start_col))
-            elif char == '>':
-                self.advance()
-                self.tokens.append(Token(TokenType.GREATER, '>', start_line, start_col))
-            elif char == '(':
-                self.advance()
-                self.tokens.append(Token(TokenType.LPAREN, '(', start_line, start_col))
-            elif char == ')':
-                self.advance()
-                self.tokens.append(Token(TokenType.RPAREN, ')', start_line, start_col))
-            elif char == ';':
-                self.advance()
-                self.tokens.append(Token(TokenType.SEMICOLON, ';', start_line, start_col))
-            elif char == ':':
-                self.advance()
-                self.tokens.append(Token(TokenType.COLON, ':', start_line, start_col))
-            elif char == ',':
-                self.advance()
-                self.tokens.append(Token(TokenType.COMMA, ',', start_line, start_col))
-            elif char == '.':
-                self.advance()
-                self.tokens.append(Token(TokenType.DOT, '.', start_line, start_col))
+            if kind == 'ID':
+                # Check if it's a keyword (case insensitive)
+                keywords = keywords_by_length.get(len(text))
+                if keywords:
+                    token_type = keywords.get(text.lower(), TokenType.ID)
+                else:
+                    token_type = TokenType.ID
+            elif kind == 'NUM':
+                token_type = TokenType.NUM
+            elif kind == 'OP':
+                token_type = operators[text]
             else:
-                raise LexerError(f"Unexpected character: '{char}'", start_line, start_col)
+                raise LexerError(f"Unexpected character: '{text}'", line, column)
+            
+            tokens_append(Token(token_type, text, line, column))
+        
+        self.pos = len(source)
+        self.line = line
+        self.column = len(source) - line_start + 1
         
         # Add EOF token
         self.tokens.append(Token(TokenType.EOF, '$', self.line, self.column))
@@ -288,55 +282,39 @@ class Lexer:
         return self.tokens
 
 
+# Token spellings accepted by tokenize_input, built once at import time
+_SIMPLE_TOKENS = {
+    'id': TokenType.ID,
+    'num': TokenType.NUM,
+    **_OPERATORS,
+    **_KEYWORDS,
+}
+
+# Numbers as tokenize_input accepts them: digits with at most one '.'
+# anywhere ("3.5", "1.", ".5").  Non-ASCII parts fall back to str.isdigit,
+# which also admits digit characters that \d does not.
+_NUM_RE = re.compile(r'(?:\d+\.?\d*|\.\d+)\Z')
+
+
+def _is_unicode_number(part: str) -> bool:
+    return part.replace('.', '').isdigit() and part.count('.') <= 1
+
+
 def tokenize_input(input_string: str) -> List[Token]:
     """Helper function to tokenize input from user"""
     # For simple token input like "id = num + id ;"
     # Parse space-separated tokens
-    simple_tokens = {
-        'id': TokenType.ID,
-        'num': TokenType.NUM,
-        '+': TokenType.PLUS,
-        '-': TokenType.MINUS,
-        '*': TokenType.MULTIPLY,
-        '/': TokenType.DIVIDE,
-        '=': TokenType.EQUAL,
-        ':=': TokenType.ASSIGN,
-        ';': TokenType.SEMICOLON,
-        ':': TokenType.COLON,
-        ',': TokenType.COMMA,
-        '.': TokenType.DOT,
-        '(': TokenType.LPAREN,
-        ')': TokenType.RPAREN,
-        '<': TokenType.LESS,
-        '>': TokenType.GREATER,
-        '<=': TokenType.LESS_EQUAL,
-        '>=': TokenType.GREATER_EQUAL,
-        '<>': TokenType.NOT_EQUAL,
-        'program': TokenType.PROGRAM,
-        'var': TokenType.VAR,
-        'begin': TokenType.BEGIN,
-        'end': TokenType.END,
-        'integer': TokenType.INTEGER,
-        'real': TokenType.REAL,
-        'boolean': TokenType.BOOLEAN,
-        'if': TokenType.IF,
-        'then': TokenType.THEN,
-        'else': TokenType.ELSE,
-        'while': TokenType.WHILE,
-        'do': TokenType.DO,
-        'read': TokenType.READ,
-        'write': TokenType.WRITE,
-        'div': TokenType.DIV,
-        'mod': TokenType.MOD,
-    }
-    
     tokens = []
     parts = input_string.strip().split()
     
+    simple_get = _SIMPLE_TOKENS.get
+    is_number = _NUM_RE.match
+    
     for i, part in enumerate(parts):
-        if part.lower() in simple_tokens:
-            tokens.append(Token(simple_tokens[part.lower()], part, 1, i+1))
-        elif part.isdigit() or (part.replace('.', '').isdigit() and part.count('.') <= 1):
+        token_type = simple_get(part.lower())
+        if token_type is not None:
+            tokens.append(Token(token_type, part, 1, i+1))
+        elif is_number(part) or (not part.isascii() and _is_unicode_number(part)):
             tokens.append(Token(TokenType.NUM, part, 1, i+1))
         elif part.isidentifier():
             tokens.append(Token(TokenType.ID, part, 1, i+1))
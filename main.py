@@ -23,6 +23,7 @@ def main():
     if len(sys.argv) > 1:
         filename = sys.argv[1]
         debug = "--debug" in sys.argv or "-d" in sys.argv
+        check_only = "--check" in sys.argv or "-c" in sys.argv
         
         print(f"\nParsing file: {filename}")
         print("-" * 40)
@@ -39,7 +40,7 @@ def main():
             return 1
         
         # Parse
-        success, tree = parse_file(filename, debug=debug)
+        success, tree = parse_file(filename, debug=debug, build_tree=not check_only)
         
         if success and tree:
             tree.print_tree(include_epsilon=False)
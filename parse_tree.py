@@ -3,33 +3,62 @@ Parse Tree Implementation for Pascal LL(1) Parser
 Builds a parse tree during parsing and provides preorder traversal output
 """
 
-from typing import List, Optional
-from dataclasses import dataclass, field
+import sys
+from typing import List, Optional, Sequence, TextIO
+from grammar import SYMBOL_NAME, SYMBOL_ID, EPSILON_ID
 
 
-@dataclass
 class ParseTreeNode:
     """
     A node in the parse tree.
-    - symbol: The grammar symbol (terminal or nonterminal)
+    - symbol_id: Index of the grammar symbol (terminal or nonterminal) in SYMBOL_NAME
     - value: The actual token value (for terminals like identifiers or numbers)
-    - children: List of child nodes
+    - children: List of child nodes, or None until the first child is added
     """
-    symbol: str
-    value: str = ""
-    children: List['ParseTreeNode'] = field(default_factory=list)
+    __slots__ = ('symbol_id', 'value', 'children', '_ne_children')
+    
+    def __init__(self, symbol_id: int, value: str = "",
+                 children: Optional[List['ParseTreeNode']] = None):
+        self.symbol_id = symbol_id
+        self.value = value
+        self.children = children
+        self._ne_children = None
+    
+    @classmethod
+    def named(cls, symbol: str, value: str = "") -> 'ParseTreeNode':
+        """Create a node from a grammar symbol name instead of its id"""
+        return cls(SYMBOL_ID[symbol], value)
+    
+    @property
+    def symbol(self) -> str:
+        """The grammar symbol name of this node"""
+        return SYMBOL_NAME[self.symbol_id]
+    
+    def __repr__(self):
+        return f"ParseTreeNode(symbol={self.symbol!r}, value={self.value!r}, children={self.children!r})"
     
     def add_child(self, child: 'ParseTreeNode'):
         """Add a child node"""
-        self.children.append(child)
+        self._ne_children = None
+        if self.children is None:
+            self.children = [child]
+        else:
+            self.children.append(child)
+    
+    def non_epsilon_children(self) -> Sequence['ParseTreeNode']:
+        """Children without epsilon nodes, computed once and then cached"""
+        if self._ne_children is None:
+            self._ne_children = [c for c in self.children if c.symbol_id != EPSILON_ID] \
+                if self.children else ()
+        return self._ne_children
     
     def is_terminal(self) -> bool:
         """Check if this node is a terminal (has no children and not epsilon)"""
-        return len(self.children) == 0 and self.symbol != 'ε'
+        return not self.children and self.symbol_id != EPSILON_ID
     
     def is_epsilon(self) -> bool:
         """Check if this is an epsilon node"""
-        return self.symbol == 'ε'
+        return self.symbol_id == EPSILON_ID
 
 
 class ParseTree:
@@ -50,164 +79,160 @@ class ParseTree:
             include_epsilon: Whether to include epsilon nodes in output
         """
         result = []
-        self._preorder_helper(self.root, result, 0, include_epsilon)
-        return result
-    
-    def _preorder_helper(self, node: Optional[ParseTreeNode], result: List[str], 
-                         depth: int, include_epsilon: bool):
-        """Recursive helper for preorder traversal"""
-        if node is None:
-            return
-        
-        # Skip epsilon nodes if not including them
-        if node.is_epsilon() and not include_epsilon:
-            return
-        
-        # Create indentation for tree structure visualization
-        indent = "  " * depth
-        
-        # Format node output
-        if node.value and node.value != node.symbol:
-            node_str = f"{indent}{node.symbol} ({node.value})"
-        else:
-            node_str = f"{indent}{node.symbol}"
+        stack = [(self.root, 0)] if self.root is not None else []
         
-        result.append(node_str)
+        while stack:
+            node, depth = stack.pop()
+            
+            # Skip epsilon nodes if not including them
+            if node.is_epsilon() and not include_epsilon:
+                continue
+            
+            # Create indentation for tree structure visualization
+            indent = "  " * depth
+            
+            # Format node output
+            symbol = SYMBOL_NAME[node.symbol_id]
+            if node.value and node.value != symbol:
+                result.append(f"{indent}{symbol} ({node.value})")
+            else:
+                result.append(f"{indent}{symbol}")
+            
+            # Push children in reverse so they are visited left to right
+            if node.children:
+                for child in reversed(node.children):
+                    stack.append((child, depth + 1))
         
-        # Recursively process children
-        for child in node.children:
-            self._preorder_helper(child, result, depth + 1, include_epsilon)
+        return result
+    
+    @staticmethod
+    def _write_block(title: str, lines: List[str], out: Optional[TextIO]):
+        """Write a framed block of lines to out (stdout by default) in one call"""
+        rule = "=" * 60
+        out = sys.stdout if out is None else out
+        out.write("\n".join(["", rule, title, rule, *lines, rule, ""]))
     
-    def print_tree(self, include_epsilon: bool = False):
+    def print_tree(self, include_epsilon: bool = False, out: Optional[TextIO] = None):
         """Print the parse tree in preorder"""
-        print("\n" + "=" * 60)
-        print("PARSE TREE (Preorder Traversal)")
-        print("=" * 60)
-        
-        traversal = self.preorder_traversal(include_epsilon)
-        for line in traversal:
-            print(line)
-        
-        print("=" * 60)
+        self._write_block("PARSE TREE (Preorder Traversal)",
+                          self.preorder_traversal(include_epsilon), out)
     
     def get_tree_string(self, include_epsilon: bool = False) -> str:
         """Get the parse tree as a string"""
         traversal = self.preorder_traversal(include_epsilon)
         return '\n'.join(traversal)
     
-    def print_graphical(self):
+    def print_graphical(self, out: Optional[TextIO] = None):
         """Print a more graphical representation of the tree"""
-        print("\n" + "=" * 60)
-        print("PARSE TREE (Graphical)")
-        print("=" * 60)
-        self._print_graphical_helper(self.root, "", True)
-        print("=" * 60)
-    
-    def _print_graphical_helper(self, node: Optional[ParseTreeNode], 
-                                 prefix: str, is_last: bool):
-        """Recursive helper for graphical tree printing"""
-        if node is None:
-            return
-        
-        # Skip epsilon nodes in graphical output
-        if node.is_epsilon():
-            return
-        
-        # Print current node (using ASCII characters for Windows compatibility)
-        connector = "+-- " if is_last else "|-- "
-        
-        # Use ASCII-safe symbol representation
-        symbol = node.symbol if node.symbol != 'ε' else "eps"
-        
-        if node.value and node.value != node.symbol:
-            print(f"{prefix}{connector}{symbol} ({node.value})")
-        else:
-            print(f"{prefix}{connector}{symbol}")
-        
-        # Prepare prefix for children (ASCII for Windows)
-        child_prefix = prefix + ("    " if is_last else "|   ")
+        self._write_block("PARSE TREE (Graphical)", self._graphical_lines(), out)
+    
+    def _graphical_lines(self) -> List[str]:
+        """Build the lines of the graphical tree, skipping epsilon nodes"""
+        lines = []
+        stack = [(self.root, "", True)] if self.root is not None else []
         
-        # Filter out epsilon children for graphical display
-        non_epsilon_children = [c for c in node.children if not c.is_epsilon()]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            
+            # Skip epsilon nodes in graphical output
+            if node.is_epsilon():
+                continue
+            
+            # Current node line (using ASCII characters for Windows compatibility)
+            connector = "+-- " if is_last else "|-- "
+            
+            symbol = SYMBOL_NAME[node.symbol_id]
+            if node.value and node.value != symbol:
+                lines.append(f"{prefix}{connector}{symbol} ({node.value})")
+            else:
+                lines.append(f"{prefix}{connector}{symbol}")
+            
+            # Prepare prefix for children (ASCII for Windows)
+            child_prefix = prefix + ("    " if is_last else "|   ")
+            
+            # Epsilon children are not shown in graphical display
+            non_epsilon_children = node.non_epsilon_children()
+            
+            # Push children in reverse so they are printed left to right
+            last = len(non_epsilon_children) - 1
+            for i in range(last, -1, -1):
+                stack.append((non_epsilon_children[i], child_prefix, i == last))
         
-        # Print children
-        for i, child in enumerate(non_epsilon_children):
-            is_child_last = (i == len(non_epsilon_children) - 1)
-            self._print_graphical_helper(child, child_prefix, is_child_last)
+        return lines
 
 
 def build_sample_tree() -> ParseTree:
     """Build a sample parse tree for testing"""
     # Sample tree for: program test; begin x := 5 end.
     
-    root = ParseTreeNode("Program")
+    root = ParseTreeNode.named("Program")
     
     # program
-    root.add_child(ParseTreeNode("program", "program"))
+    root.add_child(ParseTreeNode.named("program", "program"))
     
     # id (test)
-    root.add_child(ParseTreeNode("id", "test"))
+    root.add_child(ParseTreeNode.named("id", "test"))
     
     # ;
-    root.add_child(ParseTreeNode(";", ";"))
+    root.add_child(ParseTreeNode.named(";", ";"))
     
     # Block
-    block = ParseTreeNode("Block")
+    block = ParseTreeNode.named("Block")
     root.add_child(block)
     
     # Declarations (epsilon)
-    decl = ParseTreeNode("Declarations")
-    decl.add_child(ParseTreeNode("ε"))
+    decl = ParseTreeNode.named("Declarations")
+    decl.add_child(ParseTreeNode.named("ε"))
     block.add_child(decl)
     
     # begin
-    block.add_child(ParseTreeNode("begin", "begin"))
+    block.add_child(ParseTreeNode.named("begin", "begin"))
     
     # StmtList
-    stmt_list = ParseTreeNode("StmtList")
+    stmt_list = ParseTreeNode.named("StmtList")
     block.add_child(stmt_list)
     
     # Statement
-    stmt = ParseTreeNode("Statement")
+    stmt = ParseTreeNode.named("Statement")
     stmt_list.add_child(stmt)
     
     # Assignment: x := 5
-    stmt.add_child(ParseTreeNode("id", "x"))
-    stmt.add_child(ParseTreeNode(":=", ":="))
+    stmt.add_child(ParseTreeNode.named("id", "x"))
+    stmt.add_child(ParseTreeNode.named(":=", ":="))
     
     # Expression
-    expr = ParseTreeNode("Expression")
+    expr = ParseTreeNode.named("Expression")
     stmt.add_child(expr)
     
     # Term
-    term = ParseTreeNode("Term")
+    term = ParseTreeNode.named("Term")
     expr.add_child(term)
     
     # Factor
-    factor = ParseTreeNode("Factor")
+    factor = ParseTreeNode.named("Factor")
     term.add_child(factor)
-    factor.add_child(ParseTreeNode("num", "5"))
+    factor.add_child(ParseTreeNode.named("num", "5"))
     
     # TermP (epsilon)
-    termp = ParseTreeNode("TermP")
-    termp.add_child(ParseTreeNode("ε"))
+    termp = ParseTreeNode.named("TermP")
+    termp.add_child(ParseTreeNode.named("ε"))
     term.add_child(termp)
     
     # ExpressionP (epsilon)
-    exprp = ParseTreeNode("ExpressionP")
-    exprp.add_child(ParseTreeNode("ε"))
+    exprp = ParseTreeNode.named("ExpressionP")
+    exprp.add_child(ParseTreeNode.named("ε"))
     expr.add_child(exprp)
     
     # StmtListP (epsilon)
-    stmtlistp = ParseTreeNode("StmtListP")
-    stmtlistp.add_child(ParseTreeNode("ε"))
+    stmtlistp = ParseTreeNode.named("StmtListP")
+    stmtlistp.add_child(ParseTreeNode.named("ε"))
     stmt_list.add_child(stmtlistp)
     
     # end
-    block.add_child(ParseTreeNode("end", "end"))
+    block.add_child(ParseTreeNode.named("end", "end"))
     
     # .
-    root.add_child(ParseTreeNode(".", "."))
+    root.add_child(ParseTreeNode.named(".", "."))
     
     return ParseTree(root)
 
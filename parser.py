@@ -2,12 +2,87 @@
 Table-Driven LL(1) Parser for Pascal
 """
 
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from lexer import Token, TokenType, Lexer
-from grammar import (PARSE_TABLE, TOKEN_TO_TERMINAL, EPSILON, 
-                     is_terminal, is_nonterminal, get_production, production_to_string)
+from grammar import (PARSE_TABLE_ARR, SYMBOL_NAME, TERM_ID_BY_TYPE, N_TERM, NT_BASE,
+                     EPSILON_ID, EPSILON_ID_PROD, EOF_ID, START_ID,
+                     production_to_string)
 from parse_tree import ParseTreeNode, ParseTree
 
+# Epsilon leaves carry no value or children and are never modified after
+# parsing, so every tree shares this one node instead of allocating its own
+_EPSILON_NODE = ParseTreeNode(EPSILON_ID)
+
+# Below this many tokens the pure-Python recognizer beats the call overhead
+NUMBA_MIN_TOKENS = 256
+
+
+def _recognize_ids(token_ids, table, prod_start, prod_syms, n_term, nt_base, eof_id, start_id):
+    """
+    Recognizer kernel over plain integer arrays, compiled with Numba when present.
+    table[(nt_id - nt_base) * n_term + term_id] is a production index or -1,
+    and production k is prod_syms[prod_start[k]:prod_start[k + 1]].
+    Returns (status, pos, top_id): 0 accepted, 1 terminal mismatch,
+    2 no production, 3 stack exhausted.
+    """
+    stack = [eof_id, start_id]
+    last = len(token_ids) - 1
+    pos = 0
+    top_id = eof_id
+    
+    while len(stack) > 0:
+        top_id = stack.pop()
+        current_id = token_ids[pos]
+        
+        if top_id == eof_id and current_id == eof_id:
+            return 0, pos, top_id
+        
+        if top_id < n_term:
+            if top_id != current_id:
+                return 1, pos, top_id
+            if pos < last:
+                pos += 1
+        
+        else:
+            k = table[(top_id - nt_base) * n_term + current_id]
+            if k < 0:
+                return 2, pos, top_id
+            for i in range(prod_start[k + 1] - 1, prod_start[k] - 1, -1):
+                stack.append(prod_syms[i])
+    
+    return 3, pos, top_id
+
+
+@lru_cache(maxsize=None)
+def _compiled_recognizer():
+    """
+    Import numba on first use and return (np, kernel, table, prod_start,
+    prod_syms), or None when numba/numpy are unavailable. Kept out of
+    module import so ordinary parses never pay for loading numba.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    
+    productions = []
+    index = {}
+    table = np.full(len(PARSE_TABLE_ARR) * N_TERM, -1, dtype=np.int32)
+    for row, entries in enumerate(PARSE_TABLE_ARR):
+        for term_id, production in enumerate(entries):
+            if production is not None:
+                if production not in index:
+                    index[production] = len(productions)
+                    productions.append([s for s in production if s != EPSILON_ID])
+                table[row * N_TERM + term_id] = index[production]
+    prod_start = np.zeros(len(productions) + 1, dtype=np.int32)
+    for k, symbols in enumerate(productions):
+        prod_start[k + 1] = prod_start[k] + len(symbols)
+    prod_syms = np.array([s for symbols in productions for s in symbols], dtype=np.int32)
+    return np, njit(cache=True)(_recognize_ids), table, prod_start, prod_syms
+
 
 class ParserError(Exception):
     def __init__(self, message: str, token: Optional[Token] = None):
@@ -20,107 +95,262 @@ class ParserError(Exception):
 
 
 class LL1Parser:
-    def __init__(self, tokens: List[Token], debug: bool = False):
+    # Number of upcoming input terminals shown per debug trace step
+    TRACE_WINDOW = 8
+    
+    def __init__(self, tokens: List[Token], debug: bool = False, build_tree: bool = True):
         self.tokens = tokens
         self.pos = 0
         self.debug = debug
-        self.stack: List[Tuple[str, Optional[ParseTreeNode]]] = []
+        self.build_tree = build_tree
+        self.stack: List[Tuple[int, Optional[ParseTreeNode]]] = []
+        self._term_cache: List[str] = [t.term for t in tokens] if debug else []
     
     def current_token(self) -> Token:
         return self.tokens[self.pos] if self.pos < len(self.tokens) else self.tokens[-1]
     
     def get_terminal(self, token: Token) -> str:
-        return TOKEN_TO_TERMINAL.get(token.type, token.value)
+        return token.term
     
     def advance(self):
         if self.pos < len(self.tokens) - 1:
             self.pos += 1
     
     def parse(self) -> Tuple[bool, Optional[ParseTree]]:
-        root = ParseTreeNode("Program")
+        if self.debug:
+            success, tree = self._parse_debug()
+            return success, tree if self.build_tree else None
+        if not self.build_tree:
+            if len(self.tokens) >= NUMBA_MIN_TOKENS:
+                compiled = _compiled_recognizer()
+                if compiled is not None:
+                    return self._recognize_compiled(*compiled)
+            return self._recognize()
+        return self._parse_fast()
+    
+    def _recognize_compiled(self, np, kernel, table, prod_start, prod_syms) -> Tuple[bool, None]:
+        """Accept or reject the input with the Numba-compiled recognizer"""
+        token_ids = np.fromiter((TERM_ID_BY_TYPE[t.type.value] for t in self.tokens),
+                                dtype=np.int32, count=len(self.tokens))
+        status, pos, top_id = kernel(token_ids, table, prod_start, prod_syms,
+                                     N_TERM, NT_BASE, EOF_ID, START_ID)
+        self.pos = int(pos)
+        current = self.tokens[self.pos]
+        if status == 0:
+            return True, None
+        if status == 1:
+            raise ParserError(f"Expected '{SYMBOL_NAME[top_id]}' but found '{current.value}'", current)
+        if status == 2:
+            raise ParserError(f"No production for [{SYMBOL_NAME[top_id]}, {current.term}]", current)
+        raise ParserError("Unexpected end of parsing")
+    
+    def _recognize(self) -> Tuple[bool, None]:
+        """Accept or reject the input without building a parse tree"""
+        stack = [EOF_ID, START_ID]
+        pop = stack.pop
+        extend = stack.extend
+        tokens = self.tokens
+        last = len(tokens) - 1
+        pos = self.pos
+        table = PARSE_TABLE_ARR
+        term_ids = TERM_ID_BY_TYPE
+        
+        while stack:
+            top_id = pop()
+            current = tokens[pos]
+            current_id = term_ids[current.type.value]
+            
+            if top_id == EOF_ID and current_id == EOF_ID:
+                self.pos = pos
+                return True, None
+            
+            if top_id < N_TERM:
+                if top_id != current_id:
+                    self.pos = pos
+                    raise ParserError(f"Expected '{SYMBOL_NAME[top_id]}' but found '{current.value}'", current)
+                if pos < last:
+                    pos += 1
+            
+            else:
+                production = table[top_id - NT_BASE][current_id]
+                if production is None:
+                    self.pos = pos
+                    raise ParserError(f"No production for [{SYMBOL_NAME[top_id]}, {current.term}]", current)
+                if production is not EPSILON_ID_PROD:
+                    extend(reversed(production))
+        
+        self.pos = pos
+        raise ParserError("Unexpected end of parsing")
+    
+    def _parse_fast(self) -> Tuple[bool, Optional[ParseTree]]:
+        """Parse without tracing; hot names are bound to locals"""
+        root = ParseTreeNode(START_ID)
         tree = ParseTree(root)
-        self.stack = [('$', None), ('Program', root)]
+        stack = self.stack = [(EOF_ID, None), (START_ID, root)]
+        pop = stack.pop
+        extend = stack.extend
+        tokens = self.tokens
+        last = len(tokens) - 1
+        pos = self.pos
+        table = PARSE_TABLE_ARR
+        term_ids = TERM_ID_BY_TYPE
+        names = SYMBOL_NAME
+        node_class = ParseTreeNode
+        epsilon_node = _EPSILON_NODE
         
-        if self.debug:
-            print("\n" + "=" * 60)
-            print("LL(1) PARSING TRACE")
-            print("=" * 60)
+        while stack:
+            top_id, top_node = pop()
+            current = tokens[pos]
+            current_id = term_ids[current.type.value]
+            
+            if top_id == EOF_ID and current_id == EOF_ID:
+                self.pos = pos
+                return True, tree
+            
+            if top_id < N_TERM:
+                if top_id != current_id:
+                    self.pos = pos
+                    raise ParserError(f"Expected '{names[top_id]}' but found '{current.value}'", current)
+                if top_node:
+                    top_node.value = current.value
+                if pos < last:
+                    pos += 1
+            
+            elif top_id == EPSILON_ID:
+                if top_node:
+                    top_node.add_child(epsilon_node)
+            
+            else:
+                production = table[top_id - NT_BASE][current_id]
+                if production is None:
+                    self.pos = pos
+                    raise ParserError(f"No production for [{names[top_id]}, {current.term}]", current)
+                
+                if production is EPSILON_ID_PROD:
+                    if top_node:
+                        top_node.add_child(epsilon_node)
+                else:
+                    child_nodes = [node_class(symbol_id) for symbol_id in production]
+                    if top_node:
+                        if top_node.children is None:
+                            top_node.children = child_nodes
+                        else:
+                            top_node.children.extend(child_nodes)
+                    extend(zip(reversed(production), reversed(child_nodes)))
+        
+        self.pos = pos
+        raise ParserError("Unexpected end of parsing")
+    
+    def _parse_debug(self) -> Tuple[bool, Optional[ParseTree]]:
+        """Parse while printing the stack, input and action of every step"""
+        root = ParseTreeNode(START_ID)
+        tree = ParseTree(root)
+        self.stack = [(EOF_ID, None), (START_ID, root)]
+        
+        print("\n" + "=" * 60)
+        print("LL(1) PARSING TRACE")
+        print("=" * 60)
         
         step = 0
         while len(self.stack) > 0:
             step += 1
-            top_symbol, top_node = self.stack.pop()
+            top_id, top_node = self.stack.pop()
             current = self.current_token()
-            current_terminal = self.get_terminal(current)
+            current_id = TERM_ID_BY_TYPE[current.type.value]
             
-            if self.debug:
-                stack_syms = [s[0] for s in self.stack] + [top_symbol]
-                remaining = [self.get_terminal(t) for t in self.tokens[self.pos:]]
-                print(f"Step {step}: Stack={stack_syms}, Input={remaining}")
+            stack_syms = [SYMBOL_NAME[s[0]] for s in self.stack] + [SYMBOL_NAME[top_id]]
+            remaining = self._term_cache[self.pos:self.pos + self.TRACE_WINDOW]
+            if self.pos + self.TRACE_WINDOW < len(self._term_cache):
+                remaining.append('...')
+            print(f"Step {step}: Stack={stack_syms}, Input={remaining}")
             
-            if top_symbol == '$' and current_terminal == '$':
-                print("\n*** ACCEPTED ***")
+            if top_id == EOF_ID and current_id == EOF_ID:
                 return True, tree
             
-            if is_terminal(top_symbol) and top_symbol != EPSILON:
-                if top_symbol == current_terminal:
-                    if self.debug:
-                        print(f"  MATCH '{top_symbol}'")
+            if top_id < N_TERM:
+                if top_id == current_id:
+                    print(f"  MATCH '{SYMBOL_NAME[top_id]}'")
                     if top_node:
                         top_node.value = current.value
                     self.advance()
                 else:
-                    raise ParserError(f"Expected '{top_symbol}' but found '{current.value}'", current)
+                    raise ParserError(f"Expected '{SYMBOL_NAME[top_id]}' but found '{current.value}'", current)
             
-            elif top_symbol == EPSILON:
+            elif top_id == EPSILON_ID:
                 if top_node:
-                    top_node.add_child(ParseTreeNode(EPSILON))
+                    top_node.add_child(_EPSILON_NODE)
             
-            elif is_nonterminal(top_symbol):
-                production = get_production(top_symbol, current_terminal)
+            else:
+                production = PARSE_TABLE_ARR[top_id - NT_BASE][current_id]
                 if production is None:
-                    raise ParserError(f"No production for [{top_symbol}, {current_terminal}]", current)
+                    raise ParserError(f"No production for [{SYMBOL_NAME[top_id]}, {current.term}]", current)
                 
-                if self.debug:
-                    print(f"  APPLY: {production_to_string(top_symbol, production)}")
+                names = tuple(SYMBOL_NAME[s] for s in production)
+                print(f"  APPLY: {production_to_string(SYMBOL_NAME[top_id], names)}")
                 
-                if production == [EPSILON]:
+                if production is EPSILON_ID_PROD:
                     if top_node:
-                        top_node.add_child(ParseTreeNode(EPSILON))
+                        top_node.add_child(_EPSILON_NODE)
                 else:
-                    child_nodes = []
-                    for symbol in production:
-                        child = ParseTreeNode(symbol)
-                        child_nodes.append(child)
-                        if top_node:
-                            top_node.add_child(child)
-                    for i in range(len(production) - 1, -1, -1):
-                        self.stack.append((production[i], child_nodes[i]))
+                    child_nodes = [ParseTreeNode(symbol_id) for symbol_id in production]
+                    if top_node:
+                        if top_node.children is None:
+                            top_node.children = child_nodes
+                        else:
+                            top_node.children.extend(child_nodes)
+                    self.stack.extend(zip(reversed(production), reversed(child_nodes)))
         
         raise ParserError("Unexpected end of parsing")
 
 
-def parse_string(source: str, debug: bool = False) -> Tuple[bool, Optional[ParseTree]]:
+def _run_parser(source: str, debug: bool,
+                build_tree: bool = True) -> Tuple[bool, Optional[ParseTree], str]:
+    """Lex and parse source, returning (success, tree, status message)"""
     lexer = Lexer(source)
     try:
         tokens = lexer.tokenize()
     except Exception as e:
-        print(f"Lexer Error: {e}")
-        return False, None
+        return False, None, f"Lexer Error: {e}"
     
-    parser = LL1Parser(tokens, debug=debug)
+    parser = LL1Parser(tokens, debug=debug, build_tree=build_tree)
     try:
-        return parser.parse()
+        success, tree = parser.parse()
     except ParserError as e:
-        print(f"\n{e}")
-        return False, None
+        return False, None, f"\n{e}"
+    return success, tree, "\n*** ACCEPTED ***"
+
+
+@lru_cache(maxsize=128)
+def _parse_string_cached(source: str, build_tree: bool) -> Tuple[bool, Optional[ParseTree], str]:
+    return _run_parser(source, debug=False, build_tree=build_tree)
+
+
+def parse_string(source: str, debug: bool = False,
+                 build_tree: bool = True) -> Tuple[bool, Optional[ParseTree]]:
+    """
+    Parse Pascal source and print the outcome.
+    Non-debug results are cached by source text, so repeated calls with the
+    same source return the same ParseTree object; treat it as read-only.
+    Debug runs are never cached so the trace is always printed.
+    With build_tree=False only accept/reject is computed and the tree is None.
+    """
+    if debug:
+        success, tree, message = _run_parser(source, debug=True, build_tree=build_tree)
+    else:
+        success, tree, message = _parse_string_cached(source, build_tree)
+    print(message)
+    return success, tree
+
+
+parse_string.cache_clear = _parse_string_cached.cache_clear
 
 
-def parse_file(filename: str, debug: bool = False) -> Tuple[bool, Optional[ParseTree]]:
+def parse_file(filename: str, debug: bool = False,
+               build_tree: bool = True) -> Tuple[bool, Optional[ParseTree]]:
     try:
         with open(filename, 'r') as f:
             source = f.read()
     except IOError as e:
         print(f"Error reading file: {e}")
         return False, None
-    return parse_string(source, debug)
+    return parse_string(source, debug, build_tree)
@@ -3,28 +3,85 @@ Symbol Table Manager for Pascal LL(1) Parser
 Manages identifiers, their types, and scopes
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
-from enum import Enum, auto
+import sys
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional
 
 
-class SymbolType(Enum):
-    INTEGER = auto()
-    REAL = auto()
-    BOOLEAN = auto()
-    PROGRAM = auto()
-    UNKNOWN = auto()
+# Symbol types are plain ints so comparisons and storage stay cheap;
+# _SYMBOL_TYPE_NAMES[t] gives the display name of type t
+INTEGER, REAL, BOOLEAN, PROGRAM, UNKNOWN = range(5)
+_SYMBOL_TYPE_NAMES = ('INTEGER', 'REAL', 'BOOLEAN', 'PROGRAM', 'UNKNOWN')
+
+# print_table layout: one row format and a prebuilt header
+_ROW_FORMAT = "{:<15} {:<12} {:<12} {:<8}".format
+_TABLE_HEADER = "\n".join(["", "=" * 60, "SYMBOL TABLE", "=" * 60,
+                           _ROW_FORMAT('Name', 'Type', 'Scope Level', 'Line'), "-" * 60, ""])
+_TABLE_FOOTER = "=" * 60 + "\n\n"
+
+
+class SymbolType:
+    """Namespace for the symbol type constants (SymbolType.INTEGER, ...)"""
+    INTEGER = INTEGER
+    REAL = REAL
+    BOOLEAN = BOOLEAN
+    PROGRAM = PROGRAM
+    UNKNOWN = UNKNOWN
 
 
-@dataclass
 class Symbol:
-    name: str
-    symbol_type: SymbolType
-    scope_level: int
-    line_declared: int = 0
+    """A declared identifier; slotted so each symbol carries no instance dict"""
+    __slots__ = ('name', 'symbol_type', 'scope_level', 'line_declared')
+    
+    def __init__(self, name: str, symbol_type: int, scope_level: int, line_declared: int = 0):
+        self.name = sys.intern(name)
+        self.symbol_type = symbol_type
+        self.scope_level = scope_level
+        self.line_declared = line_declared
+    
+    def __repr__(self):
+        return f"Symbol({self.name}, {_SYMBOL_TYPE_NAMES[self.symbol_type]}, scope={self.scope_level})"
+
+
+# Pascal is case-insensitive, so every name is keyed by its lowercase form.
+# Identifiers repeat heavily, so the lowered key is computed once per
+# distinct spelling and reused afterwards.
+_intern: Dict[str, str] = {}
+
+
+def _canon(name: str) -> str:
+    """Return the case-folded lookup key for an identifier"""
+    key = _intern.get(name)
+    if key is None:
+        key = _intern[name] = sys.intern(name.lower())
+    return key
+
+
+class Identifier:
+    """
+    An identifier spelling paired with its lookup key.
+    Build one per identifier token and pass it to insert_identifier /
+    lookup_identifier so the key is never recomputed.
+    """
+    __slots__ = ('raw', 'key')
+    
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.key = _canon(raw)
     
     def __repr__(self):
-        return f"Symbol({self.name}, {self.symbol_type.name}, scope={self.scope_level})"
+        return f"Identifier({self.raw!r})"
+
+
+# Predeclared Pascal identifiers. They are shared by every table, sit
+# outside the scope stack (so they never show up in listings) and are only
+# found when no user declaration shadows them. The type names integer,
+# real and boolean are reserved words in this lexer, so they are not here.
+_BUILTIN_SYMBOLS = MappingProxyType({
+    'true': Symbol('true', BOOLEAN, 0),
+    'false': Symbol('false', BOOLEAN, 0),
+})
 
 
 class SymbolTable:
@@ -36,35 +93,63 @@ class SymbolTable:
     def __init__(self):
         self.scopes: List[Dict[str, Symbol]] = [{}]  # Stack of scope dictionaries
         self.current_scope_level = 0
+        # Innermost scope, i.e. self.scopes[-1]; hot loops may bind
+        # self._current.get locally while the scope does not change
+        self._current: Dict[str, Symbol] = self.scopes[-1]
+        # Successful lookups by spelling. Only hits are cached, so it must be
+        # cleared whenever a cached symbol can be shadowed or go out of scope.
+        self._lookup_cache: Dict[str, Symbol] = {}
+        # Every visible declaration per name, innermost last, kept in step
+        # with self.scopes so lookup is a single dict probe
+        self._visible: Dict[str, List[Symbol]] = {}
     
     def enter_scope(self):
         """Enter a new scope (e.g., entering a block)"""
         self.current_scope_level += 1
-        self.scopes.append({})
+        self._current = {}
+        self.scopes.append(self._current)
     
     def exit_scope(self):
         """Exit current scope (e.g., leaving a block)"""
         if self.current_scope_level > 0:
-            self.scopes.pop()
+            if self._current:
+                self._lookup_cache.clear()
+            visible = self._visible
+            for name_lower in self.scopes.pop():
+                shadowed = visible[name_lower]
+                shadowed.pop()
+                if not shadowed:
+                    del visible[name_lower]
             self.current_scope_level -= 1
+            self._current = self.scopes[-1]
     
-    def insert(self, name: str, symbol_type: SymbolType, line: int = 0) -> bool:
+    def insert(self, name: str, symbol_type: int, line: int = 0) -> bool:
         """
         Insert a symbol into the current scope.
         Returns True if successful, False if symbol already exists in current scope.
         """
-        name_lower = name.lower()  # Pascal is case-insensitive
-        
-        if name_lower in self.scopes[-1]:
-            return False  # Symbol already declared in current scope
-        
+        # Pascal is case-insensitive
+        return self._insert(name, _canon(name), symbol_type, line)
+    
+    def insert_identifier(self, ident: Identifier, symbol_type: int, line: int = 0) -> bool:
+        """Same as insert, for an Identifier whose key is already computed"""
+        return self._insert(ident.raw, ident.key, symbol_type, line)
+    
+    def _insert(self, name: str, name_lower: str, symbol_type: int, line: int) -> bool:
         symbol = Symbol(
             name=name,
             symbol_type=symbol_type,
             scope_level=self.current_scope_level,
             line_declared=line
         )
-        self.scopes[-1][name_lower] = symbol
+        # One probe both checks for and claims the slot
+        if self._current.setdefault(name_lower, symbol) is not symbol:
+            return False  # Symbol already declared in current scope
+        
+        shadowed = self._visible.setdefault(name_lower, [])
+        if shadowed or name_lower in _BUILTIN_SYMBOLS:
+            self._lookup_cache.clear()
+        shadowed.append(symbol)
         return True
     
     def lookup(self, name: str) -> Optional[Symbol]:
@@ -72,51 +157,59 @@ class SymbolTable:
         Look up a symbol in all scopes (from innermost to outermost).
         Returns the Symbol if found, None otherwise.
         """
-        name_lower = name.lower()
-        
-        # Search from innermost scope outward
-        for scope in reversed(self.scopes):
-            if name_lower in scope:
-                return scope[name_lower]
+        symbol = self._lookup_cache.get(name)
+        if symbol is not None:
+            return symbol
         
-        return None
+        # The innermost declaration is last in the visible list
+        key = _canon(name)
+        symbols = self._visible.get(key)
+        symbol = symbols[-1] if symbols else _BUILTIN_SYMBOLS.get(key)
+        if symbol is not None:
+            self._lookup_cache[name] = symbol
+        return symbol
+    
+    def lookup_identifier(self, ident: Identifier) -> Optional[Symbol]:
+        """Same as lookup, for an Identifier whose key is already computed"""
+        symbols = self._visible.get(ident.key)
+        return symbols[-1] if symbols else _BUILTIN_SYMBOLS.get(ident.key)
     
     def lookup_current_scope(self, name: str) -> Optional[Symbol]:
         """Look up a symbol only in the current scope"""
-        name_lower = name.lower()
-        return self.scopes[-1].get(name_lower)
+        return self._current.get(_canon(name))
     
     def get_all_symbols(self) -> List[Symbol]:
         """Get all symbols from all scopes"""
-        all_symbols = []
-        for scope in self.scopes:
-            all_symbols.extend(scope.values())
-        return all_symbols
+        return list(self.iter_all_symbols())
+    
+    def iter_all_symbols(self) -> Iterator[Symbol]:
+        """Iterate over all symbols from the outermost scope inward"""
+        return chain.from_iterable(scope.values() for scope in self.scopes)
     
     def print_table(self):
         """Print the symbol table for debugging"""
-        print("\n" + "=" * 60)
-        print("SYMBOL TABLE")
-        print("=" * 60)
-        print(f"{'Name':<15} {'Type':<12} {'Scope Level':<12} {'Line':<8}")
-        print("-" * 60)
-        
-        for level, scope in enumerate(self.scopes):
-            for name, symbol in scope.items():
-                print(f"{symbol.name:<15} {symbol.symbol_type.name:<12} {symbol.scope_level:<12} {symbol.line_declared:<8}")
-        
-        print("=" * 60 + "\n")
+        type_names = _SYMBOL_TYPE_NAMES
+        rows = [_ROW_FORMAT(symbol.name, type_names[symbol.symbol_type],
+                            symbol.scope_level, symbol.line_declared) + "\n"
+                for scope in self.scopes for symbol in scope.values()]
+        sys.stdout.write(_TABLE_HEADER + "".join(rows) + _TABLE_FOOTER)
 
 
 # Type conversion helper
-def token_type_to_symbol_type(type_name: str) -> SymbolType:
-    """Convert Pascal type name to SymbolType"""
-    type_map = {
-        'integer': SymbolType.INTEGER,
-        'real': SymbolType.REAL,
-        'boolean': SymbolType.BOOLEAN,
-    }
-    return type_map.get(type_name.lower(), SymbolType.UNKNOWN)
+_TYPE_MAP = MappingProxyType({
+    'integer': INTEGER,
+    'real': REAL,
+    'boolean': BOOLEAN,
+})
+
+
+def token_type_to_symbol_type(type_name: str) -> int:
+    """Convert Pascal type name to a symbol type constant"""
+    # Type names usually arrive lowercase already, so try them as-is first
+    symbol_type = _TYPE_MAP.get(type_name)
+    if symbol_type is None:
+        symbol_type = _TYPE_MAP.get(type_name.lower(), UNKNOWN)
+    return symbol_type
 
 
 if __name__ == "__main__":